@@ -0,0 +1,89 @@
+from flask import Blueprint, current_app, jsonify, request
+from threading import Lock
+from cachetools import TTLCache
+
+from discord_api import BOT_TOKEN, SESSION
+
+bot_bp = Blueprint('bot', __name__)
+
+# The bot's guild list is a single entry shared by every /bot/guilds_status caller.
+# Only successful fetches are stored. fetch_lock lets a single caller refresh an
+# expired entry while the others wait for its result instead of refetching.
+BOT_GUILDS_CACHE = TTLCache(maxsize=1, ttl=60)
+BOT_GUILDS_KEY = 'bot_guilds'
+cache_lock = Lock()
+fetch_lock = Lock()
+
+# Discord's maximum page size for GET /users/@me/guilds
+GUILDS_PAGE_LIMIT = 200
+
+
+def fetch_bot_guild_ids(bot_token):
+    """Return the ids of every guild the bot is in as a frozenset (cached for 60s).
+    Pages through /users/@me/guilds, so a bot in K guilds costs ceil(K/200) calls.
+    Raises on network errors or a non-200 response from Discord.
+    """
+    with cache_lock:
+        cached = BOT_GUILDS_CACHE.get(BOT_GUILDS_KEY)
+    if cached is not None:
+        return cached
+
+    with fetch_lock:
+        # Another caller may have refreshed the list while we waited for the lock
+        with cache_lock:
+            cached = BOT_GUILDS_CACHE.get(BOT_GUILDS_KEY)
+        if cached is not None:
+            return cached
+
+        headers = {'Authorization': f'Bot {bot_token}'}
+        ids = set()
+        after = None
+        while True:
+            params = {'limit': GUILDS_PAGE_LIMIT}
+            if after:
+                params['after'] = after
+            r = SESSION.get('https://discord.com/api/v10/users/@me/guilds', headers=headers, params=params, timeout=8)
+            current_app.logger.debug("Fetched bot guild page after=%s status=%s", after, r.status_code)
+            if r.status_code != 200:
+                raise RuntimeError(f'status={r.status_code} body={r.text[:300]}')
+            page = r.json()
+            ids.update(g['id'] for g in page)
+            if len(page) < GUILDS_PAGE_LIMIT:
+                break
+            after = page[-1]['id']
+
+        guild_set = frozenset(ids)
+        with cache_lock:
+            BOT_GUILDS_CACHE[BOT_GUILDS_KEY] = guild_set
+        return guild_set
+
+@bot_bp.route('/bot/guilds_status', methods=['POST'])
+def bot_guilds_status():
+    """Check which of the provided guild IDs the bot is currently a member of.
+    Expects JSON: { guild_ids: ["id1","id2", ...] }
+    Requires environment variable: DISCORD_BOT_TOKEN
+    Returns: { present: [...], missing: [...], errors: {guild_id: error_message} }
+    """
+    data = request.get_json(cache=True, silent=True)
+    if not isinstance(data, dict):
+        data = {}
+    guild_ids = data.get('guild_ids')
+    if not isinstance(guild_ids, list):
+        guild_ids = []
+
+    current_app.logger.debug("Checking bot presence for guild IDs: %s", guild_ids)
+
+    if not BOT_TOKEN:
+        current_app.logger.error("DISCORD_BOT_TOKEN missing from environment")
+        return jsonify({'error': 'DISCORD_BOT_TOKEN not configured'}), 500
+
+    try:
+        bot_guilds = fetch_bot_guild_ids(BOT_TOKEN)
+    except Exception as e:
+        current_app.logger.error("Failed to list bot guilds: %s", e)
+        return jsonify({'present': [], 'missing': [], 'errors': {gid: str(e) for gid in guild_ids}})
+
+    # Discord ids are strings; callers may send them as numbers
+    present = [gid for gid in guild_ids if str(gid) in bot_guilds]
+    missing = [gid for gid in guild_ids if str(gid) not in bot_guilds]
+    return jsonify({'present': present, 'missing': missing, 'errors': {}})
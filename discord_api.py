@@ -0,0 +1,59 @@
+import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+
+# Load .env from backend/.env or project root during local development. In production
+# (Render) environment variables are provided via the dashboard and this is a no-op.
+load_dotenv()
+
+# Discord credentials are read once at import; they do not change while running
+CLIENT_ID = os.environ.get('DISCORD_CLIENT_ID')
+CLIENT_SECRET = os.environ.get('DISCORD_CLIENT_SECRET')
+BOT_TOKEN = os.environ.get('DISCORD_BOT_TOKEN')
+
+# Shared HTTP session for all Discord calls so keep-alive connections (and their
+# TLS handshakes) are reused across requests. The adapter's pool is thread-safe.
+SESSION = requests.Session()
+# Longest Retry-After (seconds) the adapter will sleep for. Per-call timeouts do not
+# cover retry sleeps, so this bounds how long a rate-limited call can hang.
+RETRY_AFTER_MAX = 2
+# Discord rate-limits aggressively: back off (honouring Retry-After on 429s) inside
+# the adapter rather than surfacing the error and having the frontend retry.
+# Only idempotent methods (urllib3's default allow-list, which excludes POST) are
+# retried on 5xx.
+retry = Retry(
+    total=3,
+    backoff_factor=0.25,
+    backoff_jitter=0.1,
+    status_forcelist=(429, 502, 503, 504),
+    respect_retry_after_header=True,
+    retry_after_max=RETRY_AFTER_MAX,
+    raise_on_status=False  # hand the final response back instead of raising
+)
+adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+SESSION.mount('https://', adapter)
+
+# The OAuth token exchange POSTs a single-use authorization code. A 5xx may come
+# after Discord has already redeemed it, so only a 429 (request not processed) or a
+# failed connect is retried there, never a read error or other status. requests
+# picks the longest matching mount prefix.
+token_retry = Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.25,
+    backoff_jitter=0.1,
+    status_forcelist=(429,),
+    allowed_methods=frozenset(['POST']),
+    respect_retry_after_header=True,
+    retry_after_max=RETRY_AFTER_MAX,
+    raise_on_status=False
+)
+SESSION.mount('https://discord.com/api/oauth2/', HTTPAdapter(max_retries=token_retry))
+
+def extract_bearer(header):
+    """Return the token from an 'Authorization: Bearer <token>' header, or None."""
+    if header and len(header) >= 8 and header[6] == ' ' and header[:6].lower() == 'bearer':
+        return header[7:].strip() or None
+    return None
@@ -0,0 +1,134 @@
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+import hashlib
+from threading import Lock
+from cachetools import TTLCache
+
+from discord_api import CLIENT_ID, CLIENT_SECRET, SESSION, extract_bearer
+
+oauth_bp = Blueprint('oauth', __name__)
+
+# Static parts of the OAuth token-exchange request
+TOKEN_URL = 'https://discord.com/api/oauth2/token'
+_TOKEN_BASE = {
+    'client_id': CLIENT_ID,
+    'client_secret': CLIENT_SECRET,
+    'grant_type': 'authorization_code'
+}
+_FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+# The only upstream headers relayed on proxied responses. Hop-by-hop, length/encoding
+# (iter_content decodes the body) and Set-Cookie headers from Discord are dropped.
+PASS_HEADERS = ('Content-Type', 'Retry-After')
+
+# Short-lived cache for /oauth/me, keyed by a hash of the bearer token (never the
+# raw token). Only successful answers are stored so transient errors are retried.
+ME_CACHE = TTLCache(maxsize=5000, ttl=60)
+cache_lock = Lock()
+
+
+# OAuth helper endpoints (minimal proxy/exchange implementation)
+@oauth_bp.route('/oauth/exchange', methods=['POST'])
+def oauth_exchange():
+    """Exchange an authorization code for tokens using Discord's OAuth2 token endpoint.
+    Expects JSON: { code: string, redirect_uri: string }
+    Requires environment variables: DISCORD_CLIENT_ID and DISCORD_CLIENT_SECRET
+    """
+    data = request.get_json(cache=True, silent=True)
+    if not isinstance(data, dict):
+        data = {}
+    code = data.get('code')
+    redirect_uri = data.get('redirect_uri')
+
+    if not code or not redirect_uri:
+        return jsonify({'error': 'missing code or redirect_uri'}), 400
+    if not CLIENT_ID or not CLIENT_SECRET:
+        return jsonify({'error': 'server missing OAuth client credentials (set DISCORD_CLIENT_ID and DISCORD_CLIENT_SECRET)'}), 500
+
+    payload = {**_TOKEN_BASE, 'code': code, 'redirect_uri': redirect_uri}
+
+    try:
+        resp = SESSION.post(TOKEN_URL, data=payload, headers=_FORM_HEADERS, timeout=10)
+    except Exception as e:
+        return jsonify({'error': 'failed to contact Discord token endpoint', 'details': str(e)}), 502
+
+    # Always return JSON
+    try:
+        data = resp.json()
+    except Exception:
+        # If Discord returns non-JSON, return error
+        return jsonify({'error': 'Discord token endpoint returned invalid response', 'raw': resp.text}), resp.status_code
+
+    # If error from Discord, surface it
+    if resp.status_code != 200 or 'error' in data:
+        return jsonify({'error': data.get('error_description') or data.get('error') or 'Unknown error', 'raw': data}), resp.status_code
+
+    return jsonify(data), 200
+
+
+@oauth_bp.route('/oauth/me')
+def oauth_me():
+    """Proxy endpoint to fetch /users/@me from Discord using a Bearer token passed in Authorization header.
+    This avoids CORS issues when the frontend runs in the browser.
+    """
+    token = extract_bearer(request.headers.get('Authorization'))
+    if not token:
+        current_app.logger.error("Missing or invalid Authorization header")
+        return jsonify({'error': 'missing Authorization: Bearer <token> header'}), 401
+
+    current_app.logger.debug("GET /oauth/me - Received request")
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    with cache_lock:
+        cached = ME_CACHE.get(cache_key)
+    if cached is not None:
+        current_app.logger.debug("Serving /users/@me from cache")
+        return jsonify(cached)
+
+    try:
+        current_app.logger.debug("Calling Discord API /users/@me")
+        r = SESSION.get(
+            'https://discord.com/api/v10/users/@me',
+            headers={
+                'Authorization': f'Bearer {token}',
+                'Accept': 'application/json'
+            },
+            timeout=10
+        )
+        current_app.logger.debug("Discord API response status: %s", r.status_code)
+        if not r.ok:
+            current_app.logger.error("Discord API error: %s", r.text)
+    except Exception as e:
+        current_app.logger.error("Failed to contact Discord API: %s", e)
+        return jsonify({'error': 'failed to contact Discord API', 'details': str(e)}), 502
+
+    try:
+        # Verify we got valid JSON before returning
+        response_data = r.json()
+        current_app.logger.debug("Successfully got user data: %s", response_data.get('username', 'unknown'))
+        if r.status_code == 200:
+            with cache_lock:
+                ME_CACHE[cache_key] = response_data
+        return jsonify(response_data)
+    except ValueError as e:
+        current_app.logger.error("Invalid JSON response from Discord: %s", r.text[:200])
+        return jsonify({'error': 'invalid response from Discord', 'details': r.text[:200]}), 502
+
+
+@oauth_bp.route('/oauth/guilds')
+def oauth_guilds():
+    """Proxy endpoint to fetch /users/@me/guilds from Discord using a Bearer token passed in Authorization header."""
+    token = extract_bearer(request.headers.get('Authorization'))
+    if not token:
+        return jsonify({'error': 'missing Authorization: Bearer <token> header'}), 401
+
+    try:
+        r = SESSION.get('https://discord.com/api/users/@me/guilds', headers={'Authorization': f'Bearer {token}'}, stream=True, timeout=10)
+    except Exception as e:
+        return jsonify({'error': 'failed to contact Discord API', 'details': str(e)}), 502
+
+    headers = {k: r.headers[k] for k in PASS_HEADERS if k in r.headers}
+    # Relay the upstream body chunk by chunk instead of buffering it in memory. The
+    # upstream connection is released when the response closes, even if the body is
+    # never iterated (e.g. HEAD requests).
+    resp = Response(stream_with_context(r.iter_content(chunk_size=8192)), status=r.status_code, headers=headers)
+    resp.call_on_close(r.close)
+    return resp
@@ -0,0 +1,110 @@
+from flask import Blueprint, current_app, jsonify, request
+import time
+import zlib
+
+stats_bp = Blueprint('stats', __name__)
+
+# Track startup time for uptime display. Uptime is shown in minutes, so the
+# formatted string is only recomputed every UPTIME_REFRESH_SECONDS.
+UPTIME_REFRESH_SECONDS = 30
+_mono_start = time.monotonic()
+_last_uptime = (float('-inf'), '')
+
+# Simple in-memory stats (bot can update these later). Snapshots are never mutated:
+# writers build a new dict and swap STATS_REF[0], so readers take the reference
+# once and always see a complete snapshot without locking. Uptime is not stored:
+# it is measured here and merged in by current_uptime() when responding.
+STATS = {
+    "bot_name": "Whiteout Survival",
+    "servers": 0,
+    "users": 0
+}
+STATS_REF = [STATS]
+
+# Longest string /update_stats will store for a text field
+MAX_STAT_STR_LEN = 100
+
+
+def _stat_str(value):
+    """Accept short strings only; anything else (null, lists, objects...) is rejected."""
+    if isinstance(value, str) and len(value) <= MAX_STAT_STR_LEN:
+        return value
+    return None
+
+
+def _stat_int(value):
+    """Accept non-negative ints (not bools) or short ASCII digit strings."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if value >= 0 else None
+    if isinstance(value, str) and 0 < len(value) <= 18 and value.isascii() and value.isdigit():
+        return int(value)
+    return None
+
+
+# Keys the bot may set via /update_stats, with the validator for each value (None
+# means rejected). Anything else is ignored so the dict keeps its fixed shape.
+STATS_FIELDS = {
+    "bot_name": _stat_str,
+    "servers": _stat_int,
+    "users": _stat_int
+}
+
+# (snapshot, uptime, serialized body, ETag) for the last /stats response. The body is
+# rebuilt only when a new snapshot is swapped in or the uptime string changes.
+_stats_cache = (None, None, '', '')
+
+# Clients may reuse a /stats response for this long before revalidating
+STATS_CACHE_CONTROL = f"max-age={UPTIME_REFRESH_SECONDS}, must-revalidate"
+
+
+def current_uptime():
+    """Formatted uptime, recomputed at most every UPTIME_REFRESH_SECONDS."""
+    global _last_uptime
+    now = time.monotonic()
+    if now - _last_uptime[0] > UPTIME_REFRESH_SECONDS:
+        secs = int(now - _mono_start)
+        _last_uptime = (now, f"{secs // 3600}h {(secs % 3600) // 60}m")
+    return _last_uptime[1]
+
+
+@stats_bp.route("/stats")
+def stats():
+    """Frontend requests live bot stats.
+    Supports If-None-Match so polling clients get a 304 while nothing has changed.
+    """
+    global _stats_cache
+    uptime = current_uptime()
+
+    snap = STATS_REF[0]
+    cache = _stats_cache
+    if cache[0] is not snap or cache[1] != uptime:
+        body = current_app.json.dumps({**snap, "uptime": uptime})
+        # crc32 rather than hash() so the ETag is stable across restarts (hash() is salted)
+        cache = _stats_cache = (snap, uptime, body, f"{zlib.crc32(body.encode()):08x}")
+    body, etag = cache[2], cache[3]
+
+    if request.if_none_match.contains_weak(etag):
+        resp = current_app.response_class(status=304)
+    else:
+        resp = current_app.response_class(body, mimetype="application/json")
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = STATS_CACHE_CONTROL
+    return resp
+
+
+@stats_bp.route("/update_stats", methods=["POST"])
+def update_stats():
+    """Bot updates its stats here"""
+    data = request.get_json(cache=True, silent=True)
+    if not isinstance(data, dict):
+        data = {}
+    new = dict(STATS_REF[0])
+    for key, validate in STATS_FIELDS.items():
+        if key in data:
+            value = validate(data[key])
+            if value is not None:
+                new[key] = value
+    STATS_REF[0] = new
+    return jsonify({"success": True, "updated": {**new, "uptime": current_uptime()}})
@@ -0,0 +1,17 @@
+# Production entrypoint for gunicorn's gevent workers. Monkey-patching must happen
+# before app (and therefore requests/urllib3) is imported so sockets cooperate with
+# greenlets instead of blocking the whole worker.
+# Run a single worker: bot stats and the Discord caches live in process memory, so
+# with several workers an /update_stats would only reach one of them. gevent gives
+# the I/O concurrency within that one process; move shared state out of process
+# (e.g. Redis) before raising -w.
+# The Procfile runs gunicorn with --preload, so this module is imported once in the
+# master and then forked. Forking copies module state, it does not share it: each
+# worker gets its own stats and caches, which is why there is only one worker.
+# Import-time objects (session, caches, constants) also open no sockets or files
+# until first use, so the fork itself is safe.
+# Set GEVENT_MONITOR_THREAD_ENABLE=1 to get warnings about code paths that block.
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402